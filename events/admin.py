@@ -1,6 +1,90 @@
 from django.contrib import admin
+from django.core.paginator import Paginator
+from django.db import connections
+from django.utils.functional import cached_property
 
 from events.models import Event, EventCategory
 
-admin.site.register(Event)
-admin.site.register(EventCategory)
+
+class EstimatedCountPaginator(Paginator):
+    """Paginator which uses planner estimate instead of 'COUNT(*)'.
+
+    Estimate is used on PostgreSQL for unfiltered changelist only, exact
+    count is used otherwise.
+    """
+    @cached_property
+    def count(self):
+        query = self.object_list.query
+        connection = connections[self.object_list.db]
+
+        if connection.vendor == 'postgresql' and not query.where:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    'SELECT reltuples FROM pg_class WHERE relname = %s',
+                    [query.model._meta.db_table])
+                row = cursor.fetchone()
+            # 'reltuples' is 0 or -1 until table is analyzed.
+            if row and row[0] > 0:
+                return int(row[0])
+        return super(EstimatedCountPaginator, self).count
+
+
+class PostedListFilter(admin.SimpleListFilter):
+    title = 'posted'
+    parameter_name = 'posted'
+
+    def lookups(self, request, model_admin):
+        return (('yes', 'Yes'), ('no', 'No'))
+
+    def queryset(self, request, queryset):
+        if self.value() == 'yes':
+            return queryset.exclude(posted_id=0)
+        if self.value() == 'no':
+            return queryset.filter(posted_id=0)
+        return queryset
+
+
+@admin.register(Event)
+class EventAdmin(admin.ModelAdmin):
+    list_display = (
+        'id', 'title', 'city', 'start_time', 'origin', 'posted_id',
+        'categories_titles',
+    )
+    list_filter = (PostedListFilter, 'start_time')
+    # Search by primary key only, see 'get_search_results'.
+    search_fields = ('id',)
+    ordering = ('-id',)
+    filter_horizontal = ('categories',)
+    actions = ('reset_posted_id',)
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
+    def get_queryset(self, request):
+        qs = super(EventAdmin, self).get_queryset(request)
+        return qs.prefetch_related('categories')
+
+    def get_search_results(self, request, queryset, search_term):
+        search_term = search_term.strip()
+        if not search_term:
+            return queryset, False
+        if search_term.isdigit():
+            return queryset.filter(pk=int(search_term)), False
+        return queryset.none(), False
+
+    def categories_titles(self, obj):
+        # Uses prefetched categories, no query per row.
+        return ', '.join(category.title for category in obj.categories.all())
+    categories_titles.short_description = 'категории'
+
+    def reset_posted_id(self, request, queryset):
+        updated = queryset.update(posted_id=0)
+        self.message_user(
+            request, 'posted_id reset for {} events'.format(updated))
+    reset_posted_id.short_description = 'Reset posted_id of selected events'
+
+
+@admin.register(EventCategory)
+class EventCategoryAdmin(admin.ModelAdmin):
+    list_display = ('id', 'title')
+    search_fields = ('title',)
+    ordering = ('title',)
@@ -0,0 +1,144 @@
+import argparse
+import csv
+import gzip
+import io
+import sys
+from datetime import datetime, time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+
+from events.encoders import ObjectWithTimestampEncoder
+from events.models import Event
+
+
+def parse_date_option(value):
+    """Return aware datetime from 'YYYY-MM-DD[ HH:MM[:SS]]' string."""
+    parsed = parse_datetime(value)
+    if parsed is None:
+        date = parse_date(value)
+        if date is None:
+            # Raised while parsing arguments, outside of 'CommandError'
+            # handling, argparse turns this one into usage error.
+            raise argparse.ArgumentTypeError(
+                'invalid date: {}'.format(value))
+        parsed = datetime.combine(date, time())
+    if timezone.is_naive(parsed):
+        parsed = timezone.make_aware(parsed)
+    return parsed
+
+
+def iterate_in_chunks(queryset, chunk_size):
+    """Yield objects of 'queryset' fetched by chunks ordered by pk.
+
+    Every chunk is fetched by separate query (with its own prefetch), so
+    memory usage depends on 'chunk_size' only, not on table size.
+    """
+    last_pk = 0
+    while True:
+        chunk = list(
+            queryset.filter(pk__gt=last_pk).order_by('pk')[:chunk_size])
+        if not chunk:
+            return
+        yield from chunk
+        last_pk = chunk[-1].pk
+
+
+class Command(BaseCommand):
+    help = 'Stream events with categories to JSONL or CSV.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--format', choices=('jsonl', 'csv'), default='jsonl')
+        parser.add_argument(
+            '--output', default='-',
+            help='Output file path, stdout by default.')
+        parser.add_argument(
+            '--gzip', action='store_true', help='Compress output with gzip.')
+        parser.add_argument('--origin', help='Only events with this origin.')
+        posted = parser.add_mutually_exclusive_group()
+        posted.add_argument(
+            '--posted', dest='posted', action='store_true',
+            help='Only events posted to middleware.')
+        posted.add_argument(
+            '--not-posted', dest='posted', action='store_false',
+            help='Only events not posted to middleware.')
+        parser.set_defaults(posted=None)
+        parser.add_argument(
+            '--since', type=parse_date_option,
+            help='Only events starting at or after this date.')
+        parser.add_argument(
+            '--until', type=parse_date_option,
+            help='Only events starting before this date.')
+        parser.add_argument('--chunk-size', type=int, default=2000)
+
+    def get_queryset(self, options):
+        qs = Event.objects.prefetch_related('categories')
+        if options['origin']:
+            qs = qs.filter(origin=options['origin'])
+        if options['posted'] is True:
+            qs = qs.exclude(posted_id=0)
+        elif options['posted'] is False:
+            qs = qs.filter(posted_id=0)
+        if options['since']:
+            qs = qs.filter(start_time__gte=options['since'])
+        if options['until']:
+            qs = qs.filter(start_time__lt=options['until'])
+        return qs
+
+    def open_output(self, options):
+        if options['output'] == '-':
+            binary = sys.stdout.buffer
+            if options['gzip']:
+                # Closing 'GzipFile' leaves stdout open.
+                binary = gzip.GzipFile(fileobj=binary, mode='wb')
+        elif options['gzip']:
+            binary = gzip.open(options['output'], 'wb')
+        else:
+            binary = open(options['output'], 'wb')
+        return io.TextIOWrapper(binary, encoding='utf-8', newline='')
+
+    def handle(self, *args, **options):
+        if options['chunk_size'] < 1:
+            raise CommandError('--chunk-size must be positive')
+
+        fields = Event._meta.concrete_fields
+        field_names = [field.attname for field in fields] + ['categories']
+        encoder = ObjectWithTimestampEncoder()
+
+        output = self.open_output(options)
+        if options['format'] == 'csv':
+            writer = csv.writer(output)
+            writer.writerow(field_names)
+
+        exported = 0
+        try:
+            events = iterate_in_chunks(
+                self.get_queryset(options), options['chunk_size'])
+            for event in events:
+                values = [field.value_from_object(event) for field in fields]
+                categories = [
+                    category.natural_key()
+                    for category in event.categories.all()
+                ]
+
+                if options['format'] == 'csv':
+                    writer.writerow([
+                        encoder.default(value)
+                        if isinstance(value, datetime) else value
+                        for value in values
+                    ] + [';'.join(categories)])
+                else:
+                    output.write(encoder.encode(
+                        dict(zip(field_names, values + [categories]))))
+                    output.write('\n')
+                exported += 1
+        finally:
+            if options['output'] == '-' and not options['gzip']:
+                output.flush()
+                output.detach()
+            else:
+                output.close()
+
+        self.stderr.write('Exported {} events'.format(exported))
@@ -0,0 +1,99 @@
+import os
+import subprocess
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+
+# Pseudo module name, row with cost of 'django.setup()' itself: settings
+# (and so the project package with celery app), models, admin and
+# translation modules of all apps.
+SETUP = 'django.setup'
+
+# Modules already imported by 'django.setup()' (e.g. 'events.models') report
+# about 0 ms, their cost is a part of the 'django.setup' row.
+DEFAULT_MODULES = (
+    SETUP,
+    'events.utils',
+    'events.encoders',
+    'events.tasks',
+    'requests',
+    'bs4',
+    'dateparser',
+    'django.core.serializers',
+)
+
+# Executed in a fresh interpreter for every module, so modules already
+# imported by this 'manage.py' process don't hide the real import cost.
+MEASURE_SCRIPT = '''
+import importlib
+import sys
+import time
+
+import django
+
+module = sys.argv[1]
+if module != {setup!r}:
+    django.setup()
+
+before = set(sys.modules)
+start = time.perf_counter()
+if module == {setup!r}:
+    django.setup()
+else:
+    importlib.import_module(module)
+elapsed = time.perf_counter() - start
+print(elapsed, len(set(sys.modules) - before))
+'''.format(setup=SETUP)
+
+
+class Command(BaseCommand):
+    help = (
+        'Report import time of every module measured in a clean process '
+        '(after \'django.setup()\', which is measured as \'{}\').'.format(
+            SETUP))
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'modules', nargs='*', default=DEFAULT_MODULES,
+            help='Dotted module names to measure.')
+        parser.add_argument(
+            '--repeat', type=int, default=3,
+            help='Number of clean runs per module, best one is reported.')
+
+    def measure(self, module):
+        env = dict(os.environ)
+        env.setdefault('DJANGO_SETTINGS_MODULE', '{{ project_name }}.settings')
+
+        result = subprocess.run(
+            [sys.executable, '-c', MEASURE_SCRIPT, module],
+            stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+            env=env, universal_newlines=True,
+        )
+        if result.returncode != 0:
+            # Last line of traceback, e.g. 'ImportError: No module named ...'.
+            error = (result.stderr.strip().splitlines() or ['unknown'])[-1]
+            self.stderr.write('Failed to import \'{}\': {}'.format(
+                module, error))
+            return None
+
+        elapsed, new_modules = result.stdout.split()
+        return float(elapsed), int(new_modules)
+
+    def handle(self, *args, **options):
+        if options['repeat'] < 1:
+            raise CommandError('--repeat must be positive')
+
+        self.stdout.write('{:<32} {:>10} {:>10}'.format(
+            'module', 'ms', 'modules'))
+        for module in options['modules']:
+            first_run = self.measure(module)
+            if first_run is None:
+                self.stdout.write('{:<32} {:>10} {:>10}'.format(
+                    module, 'failed', '-'))
+                continue
+
+            runs = [first_run] + [
+                self.measure(module) for _ in range(options['repeat'] - 1)]
+            elapsed, new_modules = min(run for run in runs if run)
+            self.stdout.write('{:<32} {:>10.1f} {:>10}'.format(
+                module, elapsed * 1000, new_modules))
@@ -1,8 +1,18 @@
 from django.core.management.base import BaseCommand
 
+from events.profiling import force_profiling
 from events.tasks import parse_events
 
 
 class Command(BaseCommand):
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--profile', action='store_true',
+            help='Save cProfile stats and SQL query log of this run.')
+
     def handle(self, *args, **options):
-        parse_events()
+        if options['profile']:
+            with force_profiling():
+                parse_events()
+        else:
+            parse_events()
@@ -1,8 +1,17 @@
 from django.core.management.base import BaseCommand
 
+from events.profiling import PROFILE_HEADER
 from events.tasks import post_events
 
 
 class Command(BaseCommand):
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--profile', action='store_true',
+            help='Save cProfile stats and SQL query log of this run.')
+
     def handle(self, *args, **options):
-        post_events.delay()
+        if options['profile']:
+            post_events.apply_async(headers={PROFILE_HEADER: True})
+        else:
+            post_events.delay()
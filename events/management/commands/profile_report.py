@@ -0,0 +1,79 @@
+import glob
+import io
+import json
+import os
+import pstats
+from collections import defaultdict
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from events.profiling import PROFILE_SUFFIX, QUERIES_SUFFIX
+
+
+class Command(BaseCommand):
+    help = 'Summarize hotspots and SQL queries across saved task profiles.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--dir', default=None,
+            help='Directory with profiles, TASK_PROFILING_DIR by default.')
+        parser.add_argument(
+            '--task', default='',
+            help='Only use profiles of task with this name.')
+        parser.add_argument(
+            '--sort', default='cumulative',
+            help='pstats sort key (cumulative, tottime, calls...).')
+        parser.add_argument(
+            '--limit', type=int, default=20,
+            help='Number of functions and queries to show.')
+
+    def get_files(self, directory, task, suffix):
+        pattern = '{}*{}'.format(task + '-' if task else '', suffix)
+        return sorted(glob.glob(os.path.join(directory, pattern)))
+
+    def print_hotspots(self, files, sort, limit):
+        # 'self.stdout' adds newline to every write, pstats writes rows
+        # by parts, so render whole report first.
+        report = io.StringIO()
+        stats = pstats.Stats(*files, stream=report)
+        stats.strip_dirs().sort_stats(sort).print_stats(limit)
+        self.stdout.write(report.getvalue(), ending='')
+
+    def print_queries(self, files, limit):
+        counts = defaultdict(int)
+        durations = defaultdict(float)
+        total_count = total_time = 0
+
+        for file_name in files:
+            with open(file_name) as queries_file:
+                log = json.load(queries_file)
+            total_count += log['count']
+            total_time += log['time']
+            # Queries are already grouped by statement in every log.
+            for query in log['queries']:
+                counts[query['sql']] += query['count']
+                durations[query['sql']] += query['time']
+
+        self.stdout.write('{} queries, {:.3f}s total in {} runs'.format(
+            total_count, total_time, len(files)))
+        self.stdout.write('{:>8} {:>10}  {}'.format('count', 'time, s', 'sql'))
+        top = sorted(durations, key=durations.get, reverse=True)[:limit]
+        for sql in top:
+            self.stdout.write('{:>8} {:>10.3f}  {}'.format(
+                counts[sql], durations[sql], sql))
+
+    def handle(self, *args, **options):
+        directory = options['dir'] or settings.TASK_PROFILING_DIR
+
+        profile_files = self.get_files(
+            directory, options['task'], PROFILE_SUFFIX)
+        if not profile_files:
+            raise CommandError('No profiles found in {}'.format(directory))
+
+        self.print_hotspots(profile_files, options['sort'], options['limit'])
+
+        queries_files = self.get_files(
+            directory, options['task'], QUERIES_SUFFIX)
+        if queries_files:
+            self.print_queries(queries_files, options['limit'])
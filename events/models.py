@@ -27,6 +27,13 @@ class Event(models.Model):
     booking_url = models.CharField(max_length=512, blank=True, null=True)
     free = models.BooleanField(default=False)
 
+    class Meta:
+        # Admin list filters and 'post_events' (posted_id=0).
+        indexes = [
+            models.Index(fields=['start_time']),
+            models.Index(fields=['posted_id']),
+        ]
+
     def __str__(self):
         return 'Title: {}, Date: {}'.format(self.title, self.start_time)
 
@@ -0,0 +1,221 @@
+import cProfile
+import functools
+import glob
+import json
+import logging
+import os
+import random
+import re
+import threading
+import time
+import uuid
+from collections import defaultdict
+from contextlib import contextmanager
+
+from celery import current_task
+from django.conf import settings
+from django.db import connection
+
+logger = logging.getLogger('{{ project_name }}')
+
+# Celery message header which turns profiling on for a single run:
+# task.apply_async(headers={PROFILE_HEADER: True})
+PROFILE_HEADER = 'profile'
+
+PROFILE_SUFFIX = '.prof'
+QUERIES_SUFFIX = '.sql.json'
+
+# Replace literals so same queries with different parameters are grouped.
+SQL_LITERAL_RE = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+# Savepoint names are unique per transaction.atomic() block, e.g.
+# 'RELEASE SAVEPOINT "s140104217561984_x4"'.
+SQL_SAVEPOINT_RE = re.compile(r'(SAVEPOINT )"?\w+"?', re.IGNORECASE)
+
+_state = threading.local()
+
+
+class QueryRecorder(object):
+    """Replacement of 'connection.queries_log' which aggregates queries.
+
+    Debug cursor appends every executed query to 'queries_log'. Unlike the
+    default deque (capped at 'queries_limit' and shared by all tasks of a
+    worker) recorder counts all queries of the run, keeping only count and
+    time per grouped statement, so memory doesn't grow with run length.
+    """
+    maxlen = None
+
+    def __init__(self):
+        self.count = 0
+        self.time = 0.0
+        self.counts = defaultdict(int)
+        self.durations = defaultdict(float)
+
+    def append(self, query):
+        duration = float(query['time'])
+        sql = SQL_SAVEPOINT_RE.sub(r'\1?', query['sql'])
+        sql = SQL_LITERAL_RE.sub('?', sql)
+        self.count += 1
+        self.time += duration
+        self.counts[sql] += 1
+        self.durations[sql] += duration
+
+    def clear(self):
+        # 'reset_queries' must not drop statistics of the profiled run.
+        pass
+
+    def __len__(self):
+        return self.count
+
+    def __iter__(self):
+        return iter(())
+
+    def as_dict(self):
+        return {
+            'count': self.count,
+            'time': self.time,
+            'queries': [
+                {'sql': sql, 'count': count, 'time': self.durations[sql]}
+                for sql, count in self.counts.items()
+            ],
+        }
+
+
+@contextmanager
+def record_queries(recorder):
+    """Record all queries of default connection made inside the block."""
+    previous_log = connection.queries_log
+    previous_force_debug_cursor = connection.force_debug_cursor
+
+    connection.queries_log = recorder
+    connection.force_debug_cursor = True
+    try:
+        yield recorder
+    finally:
+        connection.queries_log = previous_log
+        connection.force_debug_cursor = previous_force_debug_cursor
+
+
+@contextmanager
+def force_profiling():
+    """Profile every decorated call made inside the block."""
+    previous = getattr(_state, 'forced', False)
+    _state.forced = True
+    try:
+        yield
+    finally:
+        _state.forced = previous
+
+
+def _requested_by_header():
+    if not current_task:
+        return False
+
+    request = current_task.request
+    if getattr(request, PROFILE_HEADER, None):
+        return True
+    headers = getattr(request, 'headers', None) or {}
+    return bool(headers.get(PROFILE_HEADER))
+
+
+def _should_profile(top_level):
+    # Nested decorated calls are already covered by outer profiler.
+    if getattr(_state, 'active', False):
+        return False
+    if getattr(_state, 'forced', False) or _requested_by_header():
+        return True
+
+    # Only top level calls are sampled, e.g. 'dump_to_db' called for every
+    # parsed event inside 'parse_events' is not.
+    rate = getattr(settings, 'TASK_PROFILING_RATE', 0)
+    return top_level and rate > 0 and random.random() < rate
+
+
+def _get_mtime(path):
+    try:
+        return os.path.getmtime(path)
+    except OSError:
+        # Removed by another worker.
+        return 0
+
+
+def _remove_old_profiles(directory):
+    """Keep only 'TASK_PROFILING_MAX_RUNS' latest runs in 'directory'."""
+    max_runs = getattr(settings, 'TASK_PROFILING_MAX_RUNS', 500)
+    profiles = sorted(
+        glob.glob(os.path.join(directory, '*' + PROFILE_SUFFIX)),
+        key=_get_mtime)
+
+    for profile in profiles[:max(len(profiles) - max_runs, 0)]:
+        base_name = profile[:-len(PROFILE_SUFFIX)]
+        for suffix in (PROFILE_SUFFIX, QUERIES_SUFFIX):
+            try:
+                os.remove(base_name + suffix)
+            except OSError:
+                pass
+
+
+def _save(name, profiler, recorder):
+    directory = settings.TASK_PROFILING_DIR
+    os.makedirs(directory, exist_ok=True)
+
+    # Random part keeps names of runs made in the same second unique.
+    base_name = os.path.join(directory, '{}-{}-{}-{}'.format(
+        name, time.strftime('%Y%m%d%H%M%S'), os.getpid(),
+        uuid.uuid4().hex[:8]))
+    profiler.dump_stats(base_name + PROFILE_SUFFIX)
+
+    queries_log = recorder.as_dict()
+    queries_log['task'] = name
+    with open(base_name + QUERIES_SUFFIX, 'w') as queries_file:
+        json.dump(queries_log, queries_file)
+
+    _remove_old_profiles(directory)
+
+    logger.debug('Saved profile of {} to {}'.format(name, base_name))
+
+
+def run_profiled(name, func, *args, **kwargs):
+    """Call 'func' under cProfile, save stats and SQL query log of the call.
+
+    Files are saved to 'TASK_PROFILING_DIR' as '<name>-<time>-<pid>-<id>'
+    with '.prof' and '.sql.json' suffixes. Failure to save them is logged,
+    not raised.
+    """
+    profiler = cProfile.Profile()
+    recorder = QueryRecorder()
+
+    _state.active = True
+    try:
+        with record_queries(recorder):
+            profiler.enable()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                profiler.disable()
+    finally:
+        _state.active = False
+        try:
+            _save(name, profiler, recorder)
+        except Exception:
+            logger.exception('Failed to save profile of {}'.format(name))
+
+
+def profile_task(func):
+    """Profile a fraction of calls of 'func'.
+
+    Top level call (not made from another decorated one) is profiled with
+    probability 'TASK_PROFILING_RATE'. Call is always profiled when task
+    message has 'profile' header or inside 'force_profiling' block.
+    Must be placed below '@app.task' decorator.
+    """
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        depth = getattr(_state, 'depth', 0)
+        _state.depth = depth + 1
+        try:
+            if not _should_profile(top_level=depth == 0):
+                return func(*args, **kwargs)
+            return run_profiled(func.__name__, func, *args, **kwargs)
+        finally:
+            _state.depth = depth
+    return wrapper
@@ -1,30 +1,25 @@
 import json
 import logging
 
-import requests
-from bs4 import BeautifulSoup
 from django.conf import settings
-from django.core import serializers
 from django.utils import timezone
 from django.utils import translation
-from requests import ConnectionError, RequestException, Timeout
-from django.db.models.fields import NOT_PROVIDED
+from django.utils.functional import lazy
 
 import events.utils as utils
-from events.encoders import ObjectWithTimestampEncoder
 from events.models import Event, EventCategory
-import events.processors as processors
-import dateparser
+from events.profiling import profile_task
+from events.validation import (
+    get_event_model_required_fields, validate_events)
 from {{ project_name }}.celery import app
 
-EVENT_MODEL_REQUIRED_FIELDS = tuple(
-    field.name
-    for field in Event._meta.fields if (
-        field.blank is False and
-        field.null is False and
-        field.default is NOT_PROVIDED
-        )
-)
+# 'requests' and django serializers are imported inside 'post_events', the
+# only function which uses them, so worker boot and 'manage.py' invocations
+# don't pay for them. Parsers import 'bs4'/'dateparser' themselves if needed.
+
+# Kept for parsers which import it, evaluated on first use.
+# Prefer 'get_event_model_required_fields()'.
+EVENT_MODEL_REQUIRED_FIELDS = lazy(get_event_model_required_fields, tuple)()
 
 curr_timezone = timezone.get_default_timezone()
 
@@ -38,25 +33,40 @@ def validate_event_fields(fields, ignore=(), *other_field_names):
         if not fields.get('address') and not fields.get('place_title'):
             return False, 'address or place_title'
 
-    validation_field_names = list(EVENT_MODEL_REQUIRED_FIELDS)
-    validation_field_names.extend(other_field_names)
-
     # Validate fields which are required for 'Event' model.
     # (fields which can't be null, blank, and have no defaults)
-    for field_name in validation_field_names:
-        # Check that field exists and has value,
-        if field_name not in ignore and not fields.get(field_name):
-            return False, field_name
+    for field_names in (get_event_model_required_fields(), other_field_names):
+        for field_name in field_names:
+            # Check that field exists and has value,
+            if field_name not in ignore and not fields.get(field_name):
+                return False, field_name
     return True, None
 
 
+def dump_batch_to_db(rows, ignore=(), *other_field_names, base_url=None):
+    """Validate all events fields of a page, dump valid ones to db.
+
+    Return errors report of rejected rows (see 'validate_events').
+    """
+    valid_rows, errors = validate_events(
+        rows, ignore, other_field_names, base_url)
+    for field_name, field_errors in errors.items():
+        logger.debug('Rejected {} events because of {}: {}'.format(
+            len(field_errors), field_name, field_errors))
+
+    for fields in valid_rows:
+        dump_to_db(fields)
+    return errors
+
+
 @app.task(name='events.dump_to_db')
+@profile_task
 def dump_to_db(fields, dates=None):
     if not dates:
         dates = utils.datetime_range_generator(fields.pop('start_time'),
                                                fields.pop('end_time'),
                                                hour=0, minute=0)
-        dates = dt_range_to_pairs_of_start_end_time(dates)
+        dates = utils.dt_range_to_pairs_of_start_end_time(dates)
 
     categories = fields.pop('categories', None)
     if categories:
@@ -79,12 +89,19 @@ def dump_to_db(fields, dates=None):
 
 
 @app.task(name='events.parse_events')
+@profile_task
 def parse_events():
     utils.get_robots_txt()
 
 
 @app.task(name='events.post_events')
+@profile_task
 def post_events():
+    import requests
+    from requests import ConnectionError, RequestException, Timeout
+    from django.core import serializers
+    from events.encoders import ObjectWithTimestampEncoder
+
     suffix_url = "/events/multilanguage-events/"
     url = settings.MIDDLEWARE_STORAGE_URL + suffix_url
 
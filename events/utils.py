@@ -6,12 +6,17 @@ import calendar
 import locale
 from contextlib import contextmanager
 
-import requests
 from django.conf import settings
-from bs4 import BeautifulSoup
 
+# 'requests' and 'bs4' are imported lazily inside functions which need them
+# to keep module import cheap. Settings are read on call, not on import.
 
-def get_robots_txt(base_url=settings.ROOT_URL):
+
+def get_robots_txt(base_url=None):
+    import requests
+
+    if base_url is None:
+        base_url = settings.ROOT_URL
     requests.get('/'.join((base_url, 'robots.txt')))
 
 
@@ -175,9 +180,11 @@ def extract_time_from_str(str_with_time):
     return fetched_times
 
 
-def add_root(root_url=settings.ROOT_URL, url):
+def add_root(url, root_url=None):
     if not url:
         return None
+    if root_url is None:
+        root_url = settings.ROOT_URL
     if '://' not in url:
         if url[0] is not '/':
             url = '/' + url
@@ -187,6 +194,9 @@ def add_root(root_url=settings.ROOT_URL, url):
 
 
 def get_soup(url, *, method='get', parser='html.parser', **kwargs):
+    import requests
+    from bs4 import BeautifulSoup
+
     res = getattr(requests, method)(url, **kwargs)
     if res.status_code != 200:
         raise requests.ConnectionError(
@@ -0,0 +1,125 @@
+from collections import defaultdict, namedtuple
+from functools import lru_cache
+from urllib.parse import urljoin
+
+from django.conf import settings
+from django.db.models.fields import NOT_PROVIDED
+
+from events.models import Event
+
+# Fields which values are resolved against page url if relative.
+URL_FIELDS = ('origin_url', 'cover', 'booking_url')
+
+# At least one of these fields must have value.
+PLACE_FIELDS = ('address', 'place_title')
+
+FieldSpecs = namedtuple('FieldSpecs', ('required', 'max_lengths'))
+
+
+@lru_cache(maxsize=None)
+def get_event_model_required_fields():
+    """Return names of fields which are required for 'Event' model.
+
+    Computed on first call (fields which can't be null, blank, and have
+    no defaults).
+    """
+    return tuple(
+        field.name
+        for field in Event._meta.fields if (
+            field.blank is False and
+            field.null is False and
+            field.default is NOT_PROVIDED
+            )
+    )
+
+
+@lru_cache(maxsize=None)
+def get_field_specs():
+    """Return required field names and max lengths of 'Event' fields."""
+    return FieldSpecs(
+        required=get_event_model_required_fields(),
+        max_lengths={
+            field.name: field.max_length
+            for field in Event._meta.fields if field.max_length
+        },
+    )
+
+
+def normalize_value(field_name, value, base_url):
+    # bs4 tags are replaced by their text.
+    if hasattr(value, 'get_text'):
+        value = value.get_text()
+    if isinstance(value, str):
+        value = value.strip()
+        # 'urljoin' keeps absolute, protocol-relative ('//host/...') and
+        # 'mailto:'/'tel:' urls, resolves relative ones like a browser.
+        if value and field_name in URL_FIELDS:
+            value = urljoin(base_url, value)
+    return value
+
+
+def validate_events(rows, ignore=(), required=(), base_url=None):
+    """Normalize and validate list of 'fields' dicts of events.
+
+    Parameters
+    ----------
+    rows : list of dict
+        Event fields, same as for 'dump_to_db'.
+    ignore : tuple of str
+        Field names which are not validated.
+    required : tuple of str
+        Field names which are required in addition to 'Event' ones.
+    base_url : str
+        Url of the page rows are parsed from, relative urls are resolved
+        against it. 'ROOT_URL' by default.
+
+    Returns
+    -------
+    tuple of (list of dict, dict)
+        Normalized valid rows and errors report: dict mapping field name to
+        list of '(row index, reason)' of rows rejected because of the field.
+    """
+    if base_url is None:
+        base_url = settings.ROOT_URL
+    specs = get_field_specs()
+    required_fields = tuple(
+        field_name
+        for field_name in specs.required + tuple(required)
+        if field_name not in ignore
+    )
+    max_lengths = tuple(
+        (field_name, max_length)
+        for field_name, max_length in specs.max_lengths.items()
+        if field_name not in ignore
+    )
+    check_place = not any(field_name in ignore for field_name in PLACE_FIELDS)
+
+    valid_rows = []
+    errors = defaultdict(list)
+    for index, fields in enumerate(rows):
+        row = {
+            field_name: normalize_value(field_name, value, base_url)
+            for field_name, value in fields.items()
+        }
+        row_valid = True
+
+        if check_place and not any(row.get(f) for f in PLACE_FIELDS):
+            errors[' or '.join(PLACE_FIELDS)].append((index, 'missing'))
+            row_valid = False
+
+        for field_name in required_fields:
+            if not row.get(field_name):
+                errors[field_name].append((index, 'missing'))
+                row_valid = False
+
+        for field_name, max_length in max_lengths:
+            value = row.get(field_name)
+            if isinstance(value, str) and len(value) > max_length:
+                errors[field_name].append(
+                    (index, 'longer than {}'.format(max_length)))
+                row_valid = False
+
+        if row_valid:
+            valid_rows.append(row)
+
+    return valid_rows, dict(errors)
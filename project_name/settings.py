@@ -133,6 +133,14 @@ CELERY_BROKER_URL = (
     )
 )
 
+# Fraction of 'parse_events', 'post_events' and 'dump_to_db' runs profiled
+# with cProfile (0 - disabled, 1 - every run). Single run can be profiled
+# with 'profile' task header: task.apply_async(headers={'profile': True}).
+TASK_PROFILING_RATE = 0
+TASK_PROFILING_DIR = os.path.join(BASE_DIR, 'profiles')
+# Older profiles are removed when more runs are saved.
+TASK_PROFILING_MAX_RUNS = 500
+
 LOGGING = {
     'version': 1,
     'handlers': {